@@ -4,10 +4,13 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _bundled_main_config_path() -> Path:
     """Absolute path to the bundled configs/tsconfig.yml (repository layout)."""
@@ -32,6 +35,8 @@ class ConfigLoader:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or _default_main_config_path()
         self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_stat: Optional[Tuple[int, int]] = None
+        self._server_mode: Optional[bool] = None
 
     def _ensure_config_file_from_bundle(self) -> None:
         """If TSCONFIG_CONFIG_FILE is set but missing, seed it from the bundled YAML."""
@@ -49,18 +54,33 @@ class ConfigLoader:
         env_path.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(bundled, env_path)
 
+    def _config_stat_key(self) -> Optional[Tuple[int, int]]:
+        """Get (mtime_ns, size) of the configuration file, or None if it cannot be stat'ed."""
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def load_config(self) -> Dict[str, Any]:
-        """Load the main configuration file."""
-        if self._config_cache is None:
+        """Load the main configuration file.
+
+        The parsed configuration is cached and only read again when the file's
+        modification time or size changes.
+        """
+        stat_key = self._config_stat_key()
+        if self._config_cache is None or stat_key != self._config_stat:
             try:
                 self._ensure_config_file_from_bundle()
+                stat_key = self._config_stat_key()
                 if self.config_path.exists():
                     with open(self.config_path, "r") as f:
-                        self._config_cache = yaml.safe_load(f) or {}
+                        self._config_cache = yaml.load(f, Loader=_YamlSafeLoader) or {}
                 else:
                     self._config_cache = {}
             except Exception:
                 self._config_cache = {}
+            self._config_stat = stat_key
         return self._config_cache
 
     def get_config_dir(self) -> Path:
@@ -99,14 +119,20 @@ class ConfigLoader:
     def reload_config(self):
         """Force reload of the configuration."""
         self._config_cache = None
+        self._config_stat = None
+        self._server_mode = None
 
     def is_server_mode(self) -> bool:
         """Check if server mode is enabled via environment variable.
 
         By default, runs in tracker mode (for sensor stations).
         Set TSCONFIG_SERVER_MODE=true to enable server mode (for remote configuration).
+        The mode is fixed for the lifetime of the process (routers are selected at startup),
+        so the result is cached until reload_config() is called.
         """
-        return os.environ.get("TSCONFIG_SERVER_MODE", "").lower() in ("true", "1", "yes")
+        if self._server_mode is None:
+            self._server_mode = os.environ.get("TSCONFIG_SERVER_MODE", "").lower() in ("true", "1", "yes")
+        return self._server_mode
 
     def get_config_root(self) -> Optional[Path]:
         """Get the config root directory for server mode.
@@ -1,9 +1,13 @@
 """Configuration management for tsOS."""
 
+import os
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import yaml
+
 
 class BaseConfig(ABC):
     """Base class for all configuration types."""
@@ -37,6 +41,35 @@ class BaseConfig(ABC):
         """
         pass
 
+    def _write_yaml(self, config: Dict[str, Any]) -> None:
+        """Write the configuration as YAML, replacing the file atomically.
+
+        The data is written to a temporary file next to the configuration file,
+        synced to disk and renamed over it, so neither readers nor a power loss
+        leave a partially written file. A symlinked configuration file is
+        replaced at its target, and the mode and, where permitted, the owner of
+        an existing file are kept.
+        """
+        config_file = Path(os.path.realpath(self.config_file))
+        tmp_file = config_file.with_name(config_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                yaml.safe_dump(config, f, default_flow_style=False)
+                f.flush()
+                os.fsync(f.fileno())
+            if config_file.exists():
+                shutil.copymode(config_file, tmp_file)
+                st = config_file.stat()
+                try:
+                    os.chown(tmp_file, st.st_uid, st.st_gid)
+                except OSError:
+                    # Changing the owner needs privileges (e.g. when not running as root) and is best effort
+                    pass
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
     @abstractmethod
     def validate(self, config: Dict[str, Any]) -> List[str]:
         """Validate the configuration."""
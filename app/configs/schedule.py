@@ -72,8 +72,7 @@ class ScheduleConfig(BaseConfig):
 
     def save(self, config: Dict[str, Any]) -> None:
         """Save the schedule configuration to disk."""
-        with open(self.config_file, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False)
+        self._write_yaml(config)
 
     def validate(self, config: Dict[str, Any]) -> List[str]:
         """Validate the schedule configuration."""
@@ -28,6 +28,10 @@ class ScheduleTaskEntry(BaseModel):
     stop: str
 
 
+# Resolve the forward reference now instead of on first validation
+DetectorEntry.model_rebuild()
+
+
 class LureTaskEntry(BaseModel):
     """Lure task configuration entry."""
 
@@ -90,8 +94,7 @@ class SoundscapepipeConfig(BaseConfig):
 
     def save(self, config: Dict[str, Any]) -> None:
         """Save the soundscapepipe configuration to disk."""
-        with open(self.config_file, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False)
+        self._write_yaml(config)
 
     def validate(self, config: Dict[str, Any]) -> List[str]:
         """Validate the soundscapepipe configuration."""
@@ -60,8 +60,7 @@ class TsupdateConfig(BaseConfig):
 
     def save(self, config: Dict[str, Any]) -> None:
         """Save the tsupdate configuration to disk."""
-        with open(self.config_file, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False)
+        self._write_yaml(config)
 
     def validate(self, config: Dict[str, Any]) -> List[str]:
         """Validate the tsupdate configuration."""
@@ -1333,7 +1333,7 @@ async def upload_config_zip(
         else:
             try:
                 # Use systemd-run to schedule reboot in 10 seconds
-                subprocess.run(
+                await run_subprocess_async(
                     ["systemd-run", "--on-active=10s", "systemctl", "reboot"],
                     capture_output=True,
                     text=True,
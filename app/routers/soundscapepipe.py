@@ -1,11 +1,16 @@
 """Soundscapepipe configuration endpoints."""
 
 import asyncio
+import hashlib
+import heapq
 import json
 import os
+import re
 import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from app.utils.subprocess_async import run_subprocess_async
 
@@ -20,13 +25,16 @@ def _check_alsa_available() -> bool:
 ALSA_AVAILABLE = _check_alsa_available()
 
 import yaml
-from fastapi import HTTPException, Query
+from fastapi import HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from app.config_loader import config_loader
 from app.configs.soundscapepipe import SoundscapepipeConfig
 from app.routers.base import BaseConfigRouter
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def is_system_default_device(device_name: str) -> bool:
     """Check if a device is a system default/virtual device that should be filtered out."""
@@ -121,6 +129,14 @@ class SoundscapepipeConfigUpdate(BaseModel):
     frontend_gain_pin_b: Optional[int] = Field(None, ge=0)
 
 
+def _config_update_dict(config: SoundscapepipeConfigUpdate) -> Dict[str, Any]:
+    """Convert a configuration update into the dictionary that is validated and saved."""
+    config_dict = config.model_dump(mode="python", exclude_none=True)
+    if config_dict.get("output_device_match") == "none":
+        config_dict.pop("output_device_match", None)
+    return config_dict
+
+
 # Create the router using the base class
 soundscapepipe_router = BaseConfigRouter(SoundscapepipeConfig, "soundscapepipe", "soundscapepipe")
 router = soundscapepipe_router.router
@@ -140,9 +156,7 @@ async def update_soundscapepipe(
     config: SoundscapepipeConfigUpdate,
     config_group: Optional[str] = Query(None, description="Config group name for server mode"),
 ):
-    config_dict = config.model_dump(exclude_none=True)
-    if config_dict.get("output_device_match") == "none":
-        config_dict.pop("output_device_match", None)
+    config_dict = _config_update_dict(config)
     return soundscapepipe_router.update_config_helper(config_dict, config_group)
 
 
@@ -151,19 +165,29 @@ async def validate_soundscapepipe(
     config: SoundscapepipeConfigUpdate,
     config_group: Optional[str] = Query(None, description="Config group name for server mode"),
 ):
-    config_dict = config.model_dump(exclude_none=True)
-    if config_dict.get("output_device_match") == "none":
-        config_dict.pop("output_device_match", None)
+    config_dict = _config_update_dict(config)
     return soundscapepipe_router.validate_config_helper(config_dict, config_group)
 
 
 # Keep the special endpoints that are unique to soundscapepipe
+@lru_cache(maxsize=64)
+def _load_metadata_yaml(metadata_path: str, mtime_ns: int) -> Any:
+    """Parse a model metadata.yaml file.
+
+    The file's modification time is part of the cache key, so an edited file is parsed again.
+    """
+    with open(metadata_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlSafeLoader)
+
+
+AUDIO_DEVICES_CONFIG_FILE = Path(__file__).parent.parent / "configs" / "audio_devices.yml"
+
+
 def _load_audio_devices_config() -> Dict[str, Any]:
     """Load audio devices configuration from YAML file."""
-    config_file = Path(__file__).parent.parent / "configs" / "audio_devices.yml"
     try:
-        with open(config_file, "r") as f:
-            return yaml.safe_load(f) or {"input": [], "output": []}
+        with open(AUDIO_DEVICES_CONFIG_FILE, "r") as f:
+            return yaml.load(f, Loader=_YamlSafeLoader) or {"input": [], "output": []}
     except FileNotFoundError:
         return {"input": [], "output": []}
     except Exception as e:
@@ -175,13 +199,28 @@ def _load_model_files_config() -> Dict[str, Any]:
     config_file = Path(__file__).parent.parent / "configs" / "model_files.yml"
     try:
         with open(config_file, "r") as f:
-            return yaml.safe_load(f) or {"birdedge": [], "yolobat": [], "audioprotopnet": []}
+            return yaml.load(f, Loader=_YamlSafeLoader) or {"birdedge": [], "yolobat": [], "audioprotopnet": []}
     except FileNotFoundError:
         return {"birdedge": [], "yolobat": [], "audioprotopnet": []}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load model files config: {str(e)}")
 
 
+# Card line in /proc/asound/cards, e.g.:
+# 2 [Frontend       ]: USB-Audio - trackIT Analog Frontend
+#                     trackIT Analog Frontend at usb-...
+# Captures the card number, short name, and full name
+ALSA_CARD_PATTERN = re.compile(r"^\s*(\d+)\s+\[([^\]]+)\s*\]\s*:\s*[^-]+-\s*(.+?)$")
+
+# Common PCM device names that ALSA creates for each card (used for capture and playback)
+ALSA_PCM_NAME_TEMPLATES = (
+    "hw:CARD={},DEV=0",
+    "plughw:CARD={},DEV=0",
+    "default:CARD={}",
+    "sysdefault:CARD={}",
+)
+
+
 def _parse_alsa_cards() -> List[Dict[str, Any]]:
     """Parse /proc/asound/cards to get card information.
 
@@ -193,19 +232,12 @@ def _parse_alsa_cards() -> List[Dict[str, Any]]:
         {'card_id': 2, 'short_name': 'Frontend', 'full_name': 'trackIT Analog Frontend'}
     ]
     """
-    import re
-
     cards = []
     try:
         with open("/proc/asound/cards", "r") as f:
             content = f.read()
-            # Parse format like:
-            # 2 [Frontend       ]: USB-Audio - trackIT Analog Frontend
-            #                     trackIT Analog Frontend at usb-...
-            # Pattern to match card number, short name, and full name
-            pattern = r"^\s*(\d+)\s+\[([^\]]+)\s*\]\s*:\s*[^-]+-\s*(.+?)$"
             for line in content.split("\n"):
-                match = re.match(pattern, line.strip())
+                match = ALSA_CARD_PATTERN.match(line.strip())
                 if match:
                     card_info = {
                         "card_id": int(match.group(1)),
@@ -213,7 +245,7 @@ def _parse_alsa_cards() -> List[Dict[str, Any]]:
                         "full_name": match.group(3).strip(),
                     }
                     cards.append(card_info)
-    except Exception as e:
+    except OSError as e:
         print(f"Could not read /proc/asound/cards: {e}")
 
     return cards
@@ -229,8 +261,6 @@ def _match_device_name(config_name: str, device_info: Dict[str, Any]) -> bool:
     1. Exact match or substring match with full card name
     2. Card short name appears as a word in config name
     """
-    import re
-
     config_lower = config_name.lower()
 
     # Get device information
@@ -263,29 +293,15 @@ def _query_alsa_devices() -> Dict[str, Any]:
         cards = _parse_alsa_cards()
 
         # Generate common ALSA device names for each card
-        # These are the typical PCM device names that ALSA creates
         for card in cards:
             short_name = card["short_name"]
             card_id = card["card_id"]
 
-            # Common input device names (for capture)
-            input_device_names = [
-                f"hw:CARD={short_name},DEV=0",
-                f"plughw:CARD={short_name},DEV=0",
-                f"default:CARD={short_name}",
-                f"sysdefault:CARD={short_name}",
-            ]
-
-            # Common output device names (for playback)
-            output_device_names = [
-                f"hw:CARD={short_name},DEV=0",
-                f"plughw:CARD={short_name},DEV=0",
-                f"default:CARD={short_name}",
-                f"sysdefault:CARD={short_name}",
-            ]
+            # The same PCM names are used for capture and playback
+            device_names = [template.format(short_name) for template in ALSA_PCM_NAME_TEMPLATES]
 
             # Add input devices
-            for idx, device_name in enumerate(input_device_names):
+            for device_name in device_names:
                 device_info = {
                     "index": len(input_devices),
                     "name": device_name,
@@ -298,7 +314,7 @@ def _query_alsa_devices() -> Dict[str, Any]:
                 input_devices.append(device_info)
 
             # Add output devices
-            for idx, device_name in enumerate(output_device_names):
+            for device_name in device_names:
                 device_info = {
                     "index": len(output_devices),
                     "name": device_name,
@@ -320,7 +336,120 @@ def _query_alsa_devices() -> Dict[str, Any]:
     }
 
 
-@router.get("/audio-devices")
+# Hardware enumeration results are reused for a short time so that repeated requests
+# (page loads, multiple browser tabs) do not rescan ALSA every time.
+AUDIO_DEVICES_CACHE_TTL = 30.0  # seconds
+ALSACTL_SCAN_MIN_INTERVAL = 5.0  # seconds between alsactl scans on repeated refreshes
+_audio_devices_cache: Dict[str, Any] = {"ts": 0.0, "scan_ts": 0.0, "data": None, "payload": None, "payload_key": None}
+_audio_devices_lock = asyncio.Lock()
+
+
+def invalidate_audio_devices_cache() -> None:
+    """Drop the cached hardware device list so that the next request enumerates again."""
+    _audio_devices_cache["ts"] = 0.0
+    _audio_devices_cache["data"] = None
+    _audio_devices_cache["payload"] = None
+    _audio_devices_cache["payload_key"] = None
+    _resolve_hardware_device.cache_clear()
+
+
+def _audio_devices_config_mtime() -> Optional[int]:
+    """Get the modification time of audio_devices.yml, or None if it does not exist."""
+    try:
+        return os.stat(AUDIO_DEVICES_CONFIG_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _resolve_hardware_device(config_name: str, kind: str) -> Optional[int]:
+    """Resolve a configured device name to the index of the first matching cached hardware device.
+
+    Args:
+        config_name: Device name from audio_devices.yml
+        kind: Either "input" or "output"
+
+    Results are valid for the current hardware device cache and cleared whenever it changes.
+    """
+    devices = _audio_devices_cache["data"] or {}
+    for hw_dev in devices.get(kind, []):
+        if _match_device_name(config_name, hw_dev):
+            return hw_dev["index"]
+    return None
+
+
+async def _get_hardware_audio_devices(refresh: bool) -> Dict[str, Any]:
+    """Get ALSA hardware devices, reusing a recent enumeration where possible.
+
+    Without refresh, a cached result younger than AUDIO_DEVICES_CACHE_TTL is returned.
+    Enumeration runs under a lock, so concurrent requests are coalesced into a single scan.
+    """
+    requested_at = time.monotonic()
+    async with _audio_devices_lock:
+        cached = _audio_devices_cache["data"]
+        if cached is not None:
+            cached_at = _audio_devices_cache["ts"]
+            # Another request completed a scan while this one was waiting for the lock
+            if cached_at >= requested_at:
+                return cached
+            if not refresh and time.monotonic() - cached_at < AUDIO_DEVICES_CACHE_TTL:
+                return cached
+
+        # Refresh ALSA device list if requested, coalescing rapid refreshes into one scan
+        if refresh and time.monotonic() - _audio_devices_cache["scan_ts"] >= ALSACTL_SCAN_MIN_INTERVAL:
+            _audio_devices_cache["scan_ts"] = time.monotonic()
+            try:
+                await run_subprocess_async(["alsactl", "scan"], capture_output=True, timeout=2, check=False)
+            except (subprocess.TimeoutExpired, asyncio.TimeoutError, FileNotFoundError, OSError):
+                pass
+
+        # Reading /proc/asound/cards is blocking file I/O, keep it off the event loop
+        devices = await asyncio.to_thread(_query_alsa_devices)
+        _audio_devices_cache["data"] = devices
+        _audio_devices_cache["ts"] = time.monotonic()
+        _resolve_hardware_device.cache_clear()
+        return devices
+
+
+def _match_configured_devices(
+    config_devices: List[Dict[str, Any]], kind: str
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """Keep the configured devices of one kind that are present on the hardware.
+
+    Args:
+        config_devices: Device entries from audio_devices.yml
+        kind: Either "input" or "output"
+
+    Returns the matched device entries with their hardware index, and the index of the default device.
+    """
+    channels_key = f"max_{kind}_channels"
+    devices = []
+    default_index = None
+
+    for config_device in config_devices:
+        config_name = config_device.get("name", "")
+        hw_index = _resolve_hardware_device(config_name, kind)
+        if hw_index is None:
+            continue
+
+        # Device exists on hardware, add it with actual hardware index
+        is_default = config_device.get("is_default", False)
+        if is_default:
+            default_index = hw_index
+        devices.append(
+            {
+                "index": hw_index,
+                "name": config_name,  # Use config name for consistency
+                channels_key: config_device.get(channels_key),
+                "default_sample_rate": config_device.get("default_sample_rate"),
+                "is_default": is_default,
+            }
+        )
+
+    return devices, default_index
+
+
+@router.get("/audio-devices", response_model=None)
 async def get_audio_devices(refresh: bool = True) -> Dict[str, Any]:
     """Get available audio input and output devices.
 
@@ -328,13 +457,14 @@ async def get_audio_devices(refresh: bool = True) -> Dict[str, Any]:
         refresh: Whether to force refresh the device list (default: True)
 
     In tracker mode (default): Returns devices from config file that are present on the system.
+    The result is reused until the hardware device cache or the config file changes.
     In server mode: Returns all devices from config file without validation.
     """
-    # Load configuration file
-    devices_config = _load_audio_devices_config()
+    server_mode = config_loader.is_server_mode()
 
     # In server mode or when ALSA tools are not available, return config as-is without hardware validation
-    if config_loader.is_server_mode() or not ALSA_AVAILABLE:
+    if server_mode or not ALSA_AVAILABLE:
+        devices_config = _load_audio_devices_config()
         input_devices = []
         output_devices = []
         default_input = None
@@ -342,19 +472,15 @@ async def get_audio_devices(refresh: bool = True) -> Dict[str, Any]:
 
         # Process input devices
         for idx, device in enumerate(devices_config.get("input", [])):
-            device_with_index = device.copy()
-            device_with_index["index"] = idx
             if device.get("is_default", False):
                 default_input = idx
-            input_devices.append(device_with_index)
+            input_devices.append({**device, "index": idx})
 
         # Process output devices
         for idx, device in enumerate(devices_config.get("output", [])):
-            device_with_index = device.copy()
-            device_with_index["index"] = idx
             if device.get("is_default", False):
                 default_output = idx
-            output_devices.append(device_with_index)
+            output_devices.append({**device, "index": idx})
 
         return {
             "input": input_devices,
@@ -366,84 +492,31 @@ async def get_audio_devices(refresh: bool = True) -> Dict[str, Any]:
             "filtered_devices": 0,
             "input_device_count": len(input_devices),
             "output_device_count": len(output_devices),
-            "server_mode": config_loader.is_server_mode(),
+            "server_mode": server_mode,
             "alsa_available": ALSA_AVAILABLE,
         }
 
     # Tracker mode: Validate config against actual hardware
     try:
-        # Refresh ALSA device list if requested
-        if refresh:
-            try:
-                await run_subprocess_async(["alsactl", "scan"], capture_output=True, timeout=2, check=False)
-            except (subprocess.TimeoutExpired, asyncio.TimeoutError, FileNotFoundError, OSError):
-                pass
+        # Query all available devices from hardware (rescanning ALSA if requested)
+        await _get_hardware_audio_devices(refresh)
 
-        # Query all available devices from hardware
-        alsa_devices = _query_alsa_devices()
-        hw_input_devices = alsa_devices["input"]
-        hw_output_devices = alsa_devices["output"]
+        # Reuse the previous result if neither the hardware devices nor the config changed
+        payload_key = (_audio_devices_cache["ts"], _audio_devices_config_mtime())
+        if _audio_devices_cache["payload_key"] == payload_key:
+            return {**_audio_devices_cache["payload"], "refresh_attempted": refresh}
 
-        # Filter configured devices to only include those present on hardware
-        input_devices = []
-        output_devices = []
-        default_input = None
-        default_output = None
-        config_filtered = 0
-
-        # Process input devices from config
-        for config_device in devices_config.get("input", []):
-            config_name = config_device.get("name", "")
-
-            # Find matching hardware device
-            matched_hw_device = None
-            for hw_dev in hw_input_devices:
-                if _match_device_name(config_name, hw_dev):
-                    matched_hw_device = hw_dev
-                    break
-
-            if matched_hw_device is not None:
-                # Device exists on hardware, add it with actual hardware index
-                device_info = {
-                    "index": matched_hw_device["index"],
-                    "name": config_name,  # Use config name for consistency
-                    "max_input_channels": config_device.get("max_input_channels"),
-                    "default_sample_rate": config_device.get("default_sample_rate"),
-                    "is_default": config_device.get("is_default", False),
-                }
-                if device_info["is_default"]:
-                    default_input = matched_hw_device["index"]
-                input_devices.append(device_info)
-            else:
-                config_filtered += 1
-
-        # Process output devices from config
-        for config_device in devices_config.get("output", []):
-            config_name = config_device.get("name", "")
-
-            # Find matching hardware device
-            matched_hw_device = None
-            for hw_dev in hw_output_devices:
-                if _match_device_name(config_name, hw_dev):
-                    matched_hw_device = hw_dev
-                    break
+        devices_config = _load_audio_devices_config()
 
-            if matched_hw_device is not None:
-                # Device exists on hardware, add it with actual hardware index
-                device_info = {
-                    "index": matched_hw_device["index"],
-                    "name": config_name,  # Use config name for consistency
-                    "max_output_channels": config_device.get("max_output_channels"),
-                    "default_sample_rate": config_device.get("default_sample_rate"),
-                    "is_default": config_device.get("is_default", False),
-                }
-                if device_info["is_default"]:
-                    default_output = matched_hw_device["index"]
-                output_devices.append(device_info)
-            else:
-                config_filtered += 1
+        # Filter configured devices to only include those present on hardware
+        input_devices, default_input = _match_configured_devices(devices_config.get("input", []), "input")
+        output_devices, default_output = _match_configured_devices(devices_config.get("output", []), "output")
+        config_filtered = (
+            len(devices_config.get("input", [])) - len(input_devices)
+            + len(devices_config.get("output", [])) - len(output_devices)
+        )
 
-        return {
+        payload = {
             "input": input_devices,
             "output": output_devices,
             "default_input": default_input,
@@ -456,172 +529,316 @@ async def get_audio_devices(refresh: bool = True) -> Dict[str, Any]:
             "server_mode": False,
             "config_validated": True,
         }
+        _audio_devices_cache["payload"] = payload
+        _audio_devices_cache["payload_key"] = payload_key
+        return payload
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to query audio devices: {str(e)}")
 
 
+def _load_json_file(path: str) -> Any:
+    """Parse a UTF-8 encoded JSON file."""
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 encoded JSON."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _compute_etag(body: bytes) -> str:
+    """Compute a strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _json_etag_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """Build a JSON response with an ETag, answering 304 if the client already has this body."""
+    if etag is None:
+        etag = _compute_etag(body)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Tracker-mode file listings, keyed on the modification times of their base paths
+FILE_LISTING_CACHE_TTL = 60.0  # seconds, picks up changes in nested directories
+_file_listing_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _paths_mtime_key(paths: Sequence[str]) -> Tuple[Optional[int], ...]:
+    """Get the modification times of the given paths (None for missing paths)."""
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+async def _cached_listing_response(
+    request: Request, name: str, base_paths: Sequence[str], build: Callable[[], Awaitable[Dict[str, List[str]]]]
+) -> Response:
+    """Serve a file listing from cache, rebuilding it when a base path changed or the entry expired.
+
+    Changes below the base paths do not update their mtimes, so entries also expire after
+    FILE_LISTING_CACHE_TTL.
+    """
+    key = _paths_mtime_key(base_paths)
+    entry = _file_listing_cache.get(name)
+    if entry is None or entry["key"] != key or time.monotonic() - entry["ts"] >= FILE_LISTING_CACHE_TTL:
+        body = _dump_json(await build())
+        entry = {"key": key, "ts": time.monotonic(), "body": body, "etag": _compute_etag(body)}
+        _file_listing_cache[name] = entry
+
+    return _json_etag_response(request, entry["body"], entry["etag"])
+
+
+# Directories that never hold model or lure files (filesystem metadata, caches)
+SCAN_SKIP_DIRECTORIES = frozenset({"lost+found", "System Volume Information", "__pycache__"})
+
+
+def _scan_files(
+    root: str, suffixes: Tuple[str, ...], directories: Optional[List[str]] = None, ignore_case: bool = False
+) -> List[str]:
+    """Recursively collect files below root whose name ends with one of the given suffixes.
+
+    Suffixes are matched case-sensitively, like str.endswith(), unless ignore_case is set;
+    the suffixes must then be lowercase. The tree is walked
+    with an explicit stack of os.scandir() calls, which reuse the file type reported by the
+    directory listing instead of issuing a stat() per entry. Symlinked directories are
+    listed but not descended into, and unreadable directories are skipped. Hidden
+    directories and those in SCAN_SKIP_DIRECTORIES are pruned.
+
+    If a directories list is given, every subdirectory found during the same walk is appended to it.
+    """
+    files = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name.startswith(".") or entry.name in SCAN_SKIP_DIRECTORIES:
+                            continue
+                        if directories is not None:
+                            directories.append(entry.path)
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif (entry.name.lower() if ignore_case else entry.name).endswith(suffixes):
+                        files.append(entry.path)
+        except OSError:
+            continue
+    return files
+
+
+BIRDEDGE_MODEL_PATHS = ["/home/pi/pybirdedge/birdedge/models", "/opt/pybirdedge/models"]
+YOLOBAT_MODEL_PATHS = ["/home/pi/yolobat/models", "/opt/yolobat/models"]
+AUDIOPROTOPNET_MODEL_PATHS = ["/home/pi/audioprotopnet/models", "/opt/audioprotopnet/models"]
+
+
 @router.get("/model-files")
-async def get_model_files() -> Dict[str, List[str]]:
+async def get_model_files(request: Request) -> Response:
     """Get available model files for BirdEdge and YoloBat."""
 
     # In server mode, return pre-populated list from config file
     if config_loader.is_server_mode():
-        return _load_model_files_config()
+        return _json_etag_response(request, _dump_json(_load_model_files_config()))
 
     # Tracker mode: scan filesystem for model files
+    model_paths = BIRDEDGE_MODEL_PATHS + YOLOBAT_MODEL_PATHS + AUDIOPROTOPNET_MODEL_PATHS
+    return await _cached_listing_response(request, "models", model_paths, _scan_model_files)
+
+
+async def _scan_model_files() -> Dict[str, List[str]]:
+    """Scan the filesystem for model files."""
     model_files = {"birdedge": [], "yolobat": [], "audioprotopnet": []}
+    scans = []  # (model type, directory to walk, file suffixes)
 
     # Look for BirdEdge models (only in subfolders, not root models directory)
-    birdedge_paths = ["/home/pi/pybirdedge/birdedge/models", "/opt/pybirdedge/models"]
-
-    for base_path in birdedge_paths:
-        if os.path.exists(base_path):
-            # Only search in subdirectories of the models folder
-            for item in os.listdir(base_path):
-                item_path = os.path.join(base_path, item)
-                if os.path.isdir(item_path):
-                    # Walk through this subdirectory to find .onnx files
-                    for root, dirs, files in os.walk(item_path):
-                        for file in files:
-                            if file.endswith(".onnx"):
-                                model_files["birdedge"].append(os.path.join(root, file))
-
-    # Look for YoloBat models
-    yolobat_paths = ["/home/pi/yolobat/models", "/opt/yolobat/models"]
-
-    for base_path in yolobat_paths:
-        if os.path.exists(base_path):
-            for root, dirs, files in os.walk(base_path):
-                for file in files:
-                    if file.endswith((".xml", ".onnx")):
-                        model_files["yolobat"].append(os.path.join(root, file))
-
-    # Look for AudioProtoPNet models
-    audioprotopnet_paths = ["/home/pi/audioprotopnet/models", "/opt/audioprotopnet/models"]
-
-    for base_path in audioprotopnet_paths:
-        if os.path.exists(base_path):
-            for root, dirs, files in os.walk(base_path):
-                for file in files:
-                    if file.endswith(".onnx"):
-                        model_files["audioprotopnet"].append(os.path.join(root, file))
+    for base_path in BIRDEDGE_MODEL_PATHS:
+        # Only search in subdirectories of the models folder
+        try:
+            with os.scandir(base_path) as entries:
+                scans.extend(("birdedge", entry.path, (".onnx",)) for entry in entries if entry.is_dir())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+    # Look for YoloBat and AudioProtoPNet models; _scan_files() returns nothing for missing paths
+    scans.extend(("yolobat", base_path, (".xml", ".onnx")) for base_path in YOLOBAT_MODEL_PATHS)
+    scans.extend(("audioprotopnet", base_path, (".onnx",)) for base_path in AUDIOPROTOPNET_MODEL_PATHS)
+
+    # Walk all model directories concurrently in worker threads
+    results = await asyncio.gather(*(asyncio.to_thread(_scan_files, path, suffixes) for _, path, suffixes in scans))
+    for (model_type, _, _), found in zip(scans, results):
+        model_files[model_type].extend(found)
 
     return model_files
 
 
+LURE_BASE_PATHS = [
+    "/data/lure",
+    "/home/pi/lure",
+]
+
+# Audio file extensions offered as lure files (matched case-insensitively)
+# Matched case-insensitively
+LURE_AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".m4a")
+
+
+def _scan_lure_path(base_path: str) -> Tuple[List[str], List[str]]:
+    """Get all directories (including the base path itself) and audio files below a lure base path, sorted."""
+    directories = [base_path]
+    files = _scan_files(base_path, LURE_AUDIO_EXTENSIONS, directories, ignore_case=True)
+    directories.sort()
+    files.sort()
+    return directories, files
+
+
 @router.get("/lure-files")
-async def get_lure_files() -> Dict[str, Any]:
+async def get_lure_files(request: Request) -> Response:
     """Get available lure files and directories."""
-    lure_base_paths = [
-        "/data/lure",
-        "/home/pi/lure",
+    return await _cached_listing_response(request, "lure", LURE_BASE_PATHS, _scan_lure_files)
+
+
+async def _scan_lure_files() -> Dict[str, List[str]]:
+    """Scan all existing lure base paths for directories and audio files."""
+    # Walk all existing base paths concurrently in worker threads
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_scan_lure_path, base_path) for base_path in LURE_BASE_PATHS if os.path.exists(base_path))
+    )
+
+    # Each base path is already sorted, so merge them instead of sorting everything again
+    return {
+        "directories": list(heapq.merge(*(path_directories for path_directories, _ in results))),
+        "files": list(heapq.merge(*(path_files for _, path_files in results))),
+    }
+
+
+BIRDEDGE_ETC_PATHS = ["/home/pi/pybirdedge/birdedge/etc/", "/opt/pybirdedge/etc/"]
+SPECIES_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+# Species source files that may change on a running station; their mtimes key the species cache
+SPECIES_SOURCE_FILES = tuple(
+    [
+        os.path.join(base_path, name)
+        for base_path in BIRDEDGE_ETC_PATHS
+        for name in ("sci2i.json", "eng2sci.json", "ger2sci.json")
+    ]
+    + [
+        os.path.join(SPECIES_DATA_DIR, name)
+        for name in ("birdedge_species.json", "audioprotopnet_species.json")
     ]
+)
 
-    directories = []
-    files = []
+_species_cache: Dict[str, Any] = {"mtimes": None, "data": None, "body": None, "etag": None}
 
-    for base_path in lure_base_paths:
-        if os.path.exists(base_path):
-            base_path_obj = Path(base_path)
 
-            # Get all directories (including the base path itself)
-            directories.append(str(base_path_obj))
-            for item in base_path_obj.rglob("*"):
-                if item.is_dir():
-                    directories.append(str(item))
+def _load_json_mapping(path: str) -> Dict[str, Any]:
+    """Load a JSON object from a file, returning an empty mapping if the file is missing or holds no object."""
+    try:
+        data = _load_json_file(path)
+    except FileNotFoundError:
+        return {}
+    return data if isinstance(data, dict) else {}
 
-            # Get all audio files
-            audio_extensions = [".wav", ".mp3", ".flac", ".ogg", ".m4a", ".WAV", ".MP3", ".FLAC", ".OGG", ".M4A"]
-            for ext in audio_extensions:
-                for item in base_path_obj.rglob(f"*{ext}"):
-                    if item.is_file():
-                        files.append(str(item))
 
-    return {"directories": sorted(directories), "files": sorted(files)}
+def _load_yolobat_species() -> Dict[str, Any]:
+    """Load the bundled YoloBat species mapping (abbreviation -> species data)."""
+    try:
+        return _load_json_mapping(os.path.join(SPECIES_DATA_DIR, "yolobat_species.json"))
+    except (json.JSONDecodeError, OSError):
+        # If loading fails, continue with empty mapping
+        return {}
+
+
+# Static data shipped with tsconfig, loaded once per process
+YOLOBAT_SPECIES = _load_yolobat_species()
+
+
+def _species_entry(scientific: str, english: str, german: str, abbreviation: str = "") -> Dict[str, str]:
+    """Build a species list entry with its display and lowercased search strings.
+
+    The abbreviation (e.g. a YOLOBat label) is only added to the search string.
+    """
+    return {
+        "scientific": scientific,
+        "english": english,
+        "german": german,
+        "display": f"{scientific}{f' ({english})' if english else ''}{f' / {german}' if german else ''}",
+        "searchable": (
+            scientific
+            + (f" {english}" if english else "")
+            + (f" {german}" if german else "")
+            + (f" {abbreviation}" if abbreviation else "")
+        ).lower(),
+    }
 
 
 @router.get("/species")
-async def get_species() -> Dict[str, Any]:
-    """Get available species information from detection models."""
-    species_data = {"birdedge": [], "yolobat": [], "audioprotopnet": []}
+async def get_species(request: Request, search: Optional[str] = None) -> Response:
+    """Get available species information from detection models.
 
-    # Load BirdEdge species with multi-language support
-    base_paths = ["/home/pi/pybirdedge/birdedge/etc/", "/opt/pybirdedge/etc/"]
+    The species lists and their serialized JSON are cached and only rebuilt
+    when one of the source files is added, removed or modified. If a search
+    term is given, only species whose names contain it are returned.
+    """
+    mtimes = _paths_mtime_key(SPECIES_SOURCE_FILES)
+    if _species_cache["mtimes"] != mtimes:
+        species_data = _load_species_data()
+        _species_cache["data"] = species_data
+        _species_cache["body"] = _dump_json(species_data)
+        _species_cache["etag"] = _compute_etag(_species_cache["body"])
+        _species_cache["mtimes"] = mtimes
+
+    if search:
+        term = search.lower()
+        filtered = {
+            model: [entry for entry in entries if term in entry["searchable"]]
+            for model, entries in _species_cache["data"].items()
+        }
+        return _json_etag_response(request, _dump_json(filtered))
 
-    for base_path in base_paths:
-        if os.path.exists(base_path):
-            try:
-                # Load scientific names from sci2i.json
-                sci2i_path = os.path.join(base_path, "sci2i.json")
-                eng2sci_path = os.path.join(base_path, "eng2sci.json")
-                ger2sci_path = os.path.join(base_path, "ger2sci.json")
-
-                scientific_names = set()
-                eng_to_sci = {}
-                ger_to_sci = {}
-                sci_to_eng = {}
-                sci_to_ger = {}
-
-                # Load scientific names
-                if os.path.exists(sci2i_path):
-                    with open(sci2i_path, "r", encoding="utf-8") as f:
-                        sci2i_data = json.load(f)
-                        if isinstance(sci2i_data, dict):
-                            scientific_names.update(sci2i_data.keys())
-
-                # Load English to Scientific mapping
-                if os.path.exists(eng2sci_path):
-                    with open(eng2sci_path, "r", encoding="utf-8") as f:
-                        eng2sci_data = json.load(f)
-                        if isinstance(eng2sci_data, dict):
-                            eng_to_sci.update(eng2sci_data)
-                            # Create reverse mapping (sci to eng)
-                            for eng, sci in eng2sci_data.items():
-                                if sci in scientific_names:  # Only include if species exists in model
-                                    sci_to_eng[sci] = eng
-
-                # Load German to Scientific mapping
-                if os.path.exists(ger2sci_path):
-                    with open(ger2sci_path, "r", encoding="utf-8") as f:
-                        ger2sci_data = json.load(f)
-                        if isinstance(ger2sci_data, dict):
-                            ger_to_sci.update(ger2sci_data)
-                            # Create reverse mapping (sci to ger)
-                            for ger, sci in ger2sci_data.items():
-                                if sci in scientific_names:  # Only include if species exists in model
-                                    sci_to_ger[sci] = ger
-
-                # Create comprehensive species list with all name variants
-                species_list = []
-                for sci_name in sorted(scientific_names):
-                    eng_name = sci_to_eng.get(sci_name, "")
-                    ger_name = sci_to_ger.get(sci_name, "")
-
-                    species_entry = {
-                        "scientific": sci_name,
-                        "english": eng_name,
-                        "german": ger_name,
-                        "display": f"{sci_name}"
-                        + (f" ({eng_name})" if eng_name else "")
-                        + (f" / {ger_name}" if ger_name else ""),
-                        "searchable": " ".join(filter(None, [sci_name, eng_name, ger_name])).lower(),
-                    }
-                    species_list.append(species_entry)
+    return _json_etag_response(request, _species_cache["body"], _species_cache["etag"])
 
-                species_data["birdedge"] = species_list
-                break  # Use the first path that works
 
-            except (json.JSONDecodeError, IOError):
-                # Continue to next path if this one fails
-                continue
+def _load_species_data() -> Dict[str, Any]:
+    """Load species information for all detection models from the source files."""
+    species_data = {"birdedge": [], "yolobat": [], "audioprotopnet": []}
+
+    # Load BirdEdge species with multi-language support from the first existing installation
+    base_path = next((path for path in BIRDEDGE_ETC_PATHS if os.path.isdir(path)), None)
+
+    if base_path is not None:
+        try:
+            # Scientific names from sci2i.json, English and German to scientific name mappings
+            scientific_names = set(_load_json_mapping(os.path.join(base_path, "sci2i.json")))
+            eng2sci_data = _load_json_mapping(os.path.join(base_path, "eng2sci.json"))
+            ger2sci_data = _load_json_mapping(os.path.join(base_path, "ger2sci.json"))
+
+            # Create reverse mappings, only for species that exist in the model
+            sci_to_eng = {sci: eng for eng, sci in eng2sci_data.items() if sci in scientific_names}
+            sci_to_ger = {sci: ger for ger, sci in ger2sci_data.items() if sci in scientific_names}
+
+            # Create comprehensive species list with all name variants
+            get_eng = sci_to_eng.get
+            get_ger = sci_to_ger.get
+            species_data["birdedge"] = [
+                _species_entry(sci_name, get_eng(sci_name, ""), get_ger(sci_name, ""))
+                for sci_name in sorted(scientific_names)
+            ]
+        except (json.JSONDecodeError, OSError):
+            # Fall back to the bundled species list below
+            pass
 
     # Fallback: Load BirdEdge species from JSON file if paths don't exist
     if not species_data["birdedge"]:
         try:
-            birdedge_species_path = os.path.join(os.path.dirname(__file__), "..", "data", "birdedge_species.json")
+            birdedge_species_path = os.path.join(SPECIES_DATA_DIR, "birdedge_species.json")
             if os.path.exists(birdedge_species_path):
-                with open(birdedge_species_path, "r", encoding="utf-8") as f:
-                    birdedge_species_mapping = json.load(f)
+                birdedge_species_mapping = _load_json_file(birdedge_species_path)
 
                 # Create species list with display information
                 birdedge_species_list = []
@@ -630,61 +847,31 @@ async def get_species() -> Dict[str, Any]:
                     english = data.get("english", "")
                     german = data.get("german", "")
 
-                    species_entry = {
-                        "scientific": scientific,
-                        "english": english,
-                        "german": german,
-                        "display": f"{scientific}"
-                        + (f" ({english})" if english else "")
-                        + (f" / {german}" if german else ""),
-                        "searchable": " ".join(filter(None, [scientific, english, german])).lower(),
-                    }
-                    birdedge_species_list.append(species_entry)
+                    birdedge_species_list.append(_species_entry(scientific, english, german))
 
                 species_data["birdedge"] = sorted(birdedge_species_list, key=lambda x: x["scientific"])
         except (json.JSONDecodeError, IOError):
             # If loading fails, keep birdedge empty
             species_data["birdedge"] = []
 
-    # Load YoloBat species from JSON file (now with abbreviations as keys)
-    try:
-        yolobat_species_path = os.path.join(os.path.dirname(__file__), "..", "data", "yolobat_species.json")
-        if os.path.exists(yolobat_species_path):
-            with open(yolobat_species_path, "r", encoding="utf-8") as f:
-                yolobat_species_mapping = json.load(f)
-
-            # Create species list with display information
-            yolobat_species_list = []
-            for abbreviation, data in yolobat_species_mapping.items():
-                scientific = data.get("scientific", abbreviation)
-                english = data.get("english", "")
-                german = data.get("german", "")
+    # Create YoloBat species list with display information (abbreviations as keys)
+    yolobat_species_list = []
+    for abbreviation, data in YOLOBAT_SPECIES.items():
+        scientific = data.get("scientific", abbreviation)
+        english = data.get("english", "")
+        german = data.get("german", "")
 
-                species_entry = {
-                    "scientific": scientific,
-                    "english": english,
-                    "german": german,
-                    "modelLabel": abbreviation,  # Store the abbreviation for model use
-                    "display": f"{scientific}"
-                    + (f" ({english})" if english else "")
-                    + (f" / {german}" if german else ""),
-                    "searchable": " ".join(filter(None, [scientific, english, german, abbreviation])).lower(),
-                }
-                yolobat_species_list.append(species_entry)
+        species_entry = _species_entry(scientific, english, german, abbreviation)
+        species_entry["modelLabel"] = abbreviation  # Store the abbreviation for model use
+        yolobat_species_list.append(species_entry)
 
-            species_data["yolobat"] = sorted(yolobat_species_list, key=lambda x: x["scientific"])
-    except (json.JSONDecodeError, IOError):
-        # If loading fails, keep yolobat empty
-        species_data["yolobat"] = []
+    species_data["yolobat"] = sorted(yolobat_species_list, key=lambda x: x["scientific"])
 
     # Load AudioProtoPNet species from JSON file (same format as birdedge)
     try:
-        audioprotopnet_species_path = os.path.join(
-            os.path.dirname(__file__), "..", "data", "audioprotopnet_species.json"
-        )
+        audioprotopnet_species_path = os.path.join(SPECIES_DATA_DIR, "audioprotopnet_species.json")
         if os.path.exists(audioprotopnet_species_path):
-            with open(audioprotopnet_species_path, "r", encoding="utf-8") as f:
-                audioprotopnet_species_mapping = json.load(f)
+            audioprotopnet_species_mapping = _load_json_file(audioprotopnet_species_path)
 
             audioprotopnet_species_list = []
             for audioprotopnet_id, data in audioprotopnet_species_mapping.items():
@@ -692,16 +879,7 @@ async def get_species() -> Dict[str, Any]:
                 english = data.get("english", "")
                 german = data.get("german", "")
 
-                species_entry = {
-                    "scientific": scientific,
-                    "english": english,
-                    "german": german,
-                    "display": f"{scientific}"
-                    + (f" ({english})" if english else "")
-                    + (f" / {german}" if german else ""),
-                    "searchable": " ".join(filter(None, [scientific, english, german])).lower(),
-                }
-                audioprotopnet_species_list.append(species_entry)
+                audioprotopnet_species_list.append(_species_entry(scientific, english, german))
 
             species_data["audioprotopnet"] = sorted(
                 audioprotopnet_species_list, key=lambda x: x["scientific"]
@@ -733,8 +911,7 @@ async def get_yolobat_labels(model_path: str) -> Dict[str, Any]:
 
         # Load and parse the metadata.yaml file
         try:
-            with open(metadata_path, "r", encoding="utf-8") as f:
-                metadata = yaml.safe_load(f)
+            metadata = _load_metadata_yaml(metadata_path, os.stat(metadata_path).st_mtime_ns)
         except yaml.YAMLError as e:
             raise HTTPException(status_code=500, detail=f"Failed to parse metadata.yaml: {str(e)}")
         except Exception as e:
@@ -781,40 +958,18 @@ async def get_yolobat_labels(model_path: str) -> Dict[str, Any]:
             elif isinstance(label, (int, float)):
                 clean_labels.append(str(label))
 
-        # Load YoloBat species mapping to enhance labels with common names
+        # Enhance labels with common names from the YoloBat species mapping
         enhanced_labels = []
-        yolobat_species_mapping = {}
-
-        try:
-            # Load species mapping (abbreviation -> species data)
-            yolobat_species_path = os.path.join(os.path.dirname(__file__), "..", "data", "yolobat_species.json")
-            if os.path.exists(yolobat_species_path):
-                with open(yolobat_species_path, "r", encoding="utf-8") as f:
-                    yolobat_species_mapping = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            # If loading fails, continue with empty mapping
-            pass
-
-        # Enhance labels with species information
         for label in clean_labels:
             # Look up the label directly in the mapping (labels are now keys)
-            if label in yolobat_species_mapping:
-                species_data = yolobat_species_mapping[label]
-                scientific_name = species_data.get("scientific", label)
-                enhanced_label = {
-                    "scientific": scientific_name,
-                    "english": species_data.get("english", ""),
-                    "german": species_data.get("german", ""),
-                    "display": f"{scientific_name}"
-                    + (f" ({species_data.get('english', '')})" if species_data.get("english") else "")
-                    + (f" / {species_data.get('german', '')}" if species_data.get("german") else ""),
-                    "searchable": " ".join(
-                        filter(
-                            None,
-                            [scientific_name, species_data.get("english", ""), species_data.get("german", ""), label],
-                        )
-                    ).lower(),
-                }
+            if label in YOLOBAT_SPECIES:
+                species_data = YOLOBAT_SPECIES[label]
+                enhanced_label = _species_entry(
+                    species_data.get("scientific", label),
+                    species_data.get("english", ""),
+                    species_data.get("german", ""),
+                    label,
+                )
             else:
                 # No mapping found, use original label (could be unknown species or non-species like feeding-buzz)
                 enhanced_label = {
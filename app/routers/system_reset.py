@@ -1,7 +1,11 @@
 """System reset endpoints."""
 
+import asyncio
+import os
 import shutil
+import subprocess
 from pathlib import Path
+from typing import List
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
@@ -34,6 +38,39 @@ class SystemResetResponse(BaseModel):
     message: str = ""
 
 
+def _wipe_overlay(path: Path) -> None:
+    """Remove all entries directly below the overlay path, keeping the path itself."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _list_overlay(path: Path) -> List[str]:
+    """List the paths of all entries directly below the overlay path."""
+    with os.scandir(path) as entries:
+        return [entry.path for entry in entries]
+
+
+async def _wipe_overlay_async(path: Path) -> None:
+    """Remove all entries below the overlay path with rm -rf, falling back to Python if that fails."""
+    entries = await asyncio.to_thread(_list_overlay, path)
+    if not entries:
+        return
+
+    try:
+        result = await run_subprocess_async(["rm", "-rf", "--", *entries], capture_output=True, timeout=300)
+        if result.returncode == 0:
+            return
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        pass
+
+    # Remove whatever rm left behind; this raises if entries really cannot be deleted
+    await asyncio.to_thread(_wipe_overlay, path)
+
+
 @router.post("", response_model=SystemResetResponse)
 async def system_reset(request: SystemResetRequest) -> SystemResetResponse:
     """Execute system reset steps: reset config and/or wipe overlay.
@@ -80,11 +117,8 @@ async def system_reset(request: SystemResetRequest) -> SystemResetResponse:
                 detail=f"Overlay path does not exist or is not a directory: {OVERLAY_PATH}",
             )
         try:
-            for item in OVERLAY_PATH.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
+            # Deleting a full overlay can take a while, keep the event loop responsive
+            await _wipe_overlay_async(OVERLAY_PATH)
             wipe_overlay_done = True
             reboot_needed = True
         except OSError as e:
@@ -1,13 +1,16 @@
 """Systemd services management router."""
 
 import asyncio
+import json
+import os
 import subprocess
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import methodcaller
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import psutil
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
@@ -19,6 +22,31 @@ router = APIRouter(prefix="/api/systemd", tags=["systemd"])
 # Empty default services configuration - no services loaded by default
 DEFAULT_SERVICES_CONFIG = {"services": []}
 
+# Upper bound for concurrently running systemctl processes when services are queried one by one
+DEFAULT_SYSTEMCTL_CONCURRENCY = 16
+
+
+def _systemctl_concurrency_from_env() -> int:
+    """Read TSCONFIG_SYSTEMCTL_CONCURRENCY, using the default for missing or invalid values."""
+    try:
+        return max(1, int(os.environ.get("TSCONFIG_SYSTEMCTL_CONCURRENCY", DEFAULT_SYSTEMCTL_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_SYSTEMCTL_CONCURRENCY
+
+
+SYSTEMCTL_CONCURRENCY = _systemctl_concurrency_from_env()
+_systemctl_semaphore = asyncio.Semaphore(SYSTEMCTL_CONCURRENCY)
+# Serializes state-changing systemctl commands (service actions, reboot)
+_systemd_write_lock = asyncio.Lock()
+
+# Options for systemctl show: service status including timestamps and type
+SYSTEMCTL_SHOW_OPTIONS = (
+    "--no-pager",
+    "--property=ActiveState,UnitFileState,Description,"
+    "ActiveEnterTimestamp,InactiveEnterTimestamp,StateChangeTimestamp,"
+    "ActiveEnterTimestampMonotonic,InactiveEnterTimestampMonotonic,StateChangeTimestampMonotonic,Type",
+)
+
 
 class ServiceConfig(BaseModel):
     """Service configuration model."""
@@ -54,12 +82,25 @@ class ServiceAction(BaseModel):
     action: str
 
 
+# Validated services configuration, the config loader list it was built from, and the set of service names
+_services_config_cache: Dict[str, Any] = {"source": None, "config": None, "names": None}
+
+
 def get_services_config() -> ServicesConfigFile:
-    """Get services configuration from the main config loader."""
+    """Get services configuration from the main config loader.
+
+    The config loader returns the same list until tsconfig.yml changes, so the
+    validated configuration is reused as long as the source list is identical.
+    """
     try:
         services_data = config_loader.get_services_config()
         if services_data:
-            return ServicesConfigFile(services=services_data)
+            if _services_config_cache["source"] is not services_data:
+                config = ServicesConfigFile(services=services_data)
+                _services_config_cache["config"] = config
+                _services_config_cache["names"] = frozenset(service.name for service in config.services)
+                _services_config_cache["source"] = services_data
+            return _services_config_cache["config"]
     except Exception:
         pass
     return ServicesConfigFile(**DEFAULT_SERVICES_CONFIG)
@@ -74,6 +115,14 @@ def get_configured_services(include_expert: bool = True) -> List[ServiceConfig]:
         return [service for service in config.services if not service.expert]
 
 
+def get_configured_service_names() -> FrozenSet[str]:
+    """Get the names of all configured services (including expert services)."""
+    config = get_services_config()
+    if config is _services_config_cache["config"]:
+        return _services_config_cache["names"]
+    return frozenset(service.name for service in config.services)
+
+
 def format_uptime_from_seconds(total_seconds: float) -> str:
     """Format uptime from seconds into a human-readable string."""
     try:
@@ -98,100 +147,190 @@ def format_uptime_from_seconds(total_seconds: float) -> str:
         return "N/A"
 
 
-def calculate_service_uptime(properties: Dict[str, str], active_state: str) -> Optional[str]:
-    """Calculate how long the service has been in its current state."""
+# Timestamp formats reported by systemctl show
+SYSTEMD_TIMESTAMP_FORMATS = [
+    "%a %Y-%m-%d %H:%M:%S %Z",  # "Tue 2024-11-19 14:39:37 CET"
+    "%Y-%m-%d %H:%M:%S %Z",  # "2024-11-19 14:39:37 CET"
+    "%Y-%m-%d %H:%M:%S",  # "2024-11-19 14:39:37"
+    "%a %b %d %H:%M:%S %Y",  # "Tue Nov 19 14:39:37 2024"
+]
+
+# A host reports all timestamps in one format, so try the last matching one first
+_last_timestamp_format = SYSTEMD_TIMESTAMP_FORMATS[0]
+
+
+def parse_systemd_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse a systemd timestamp string, returning None if no known format matches."""
+    global _last_timestamp_format
+    try:
+        return datetime.strptime(timestamp_str, _last_timestamp_format)
+    except ValueError:
+        pass
+
+    for fmt in SYSTEMD_TIMESTAMP_FORMATS:
+        if fmt == _last_timestamp_format:
+            continue
+        try:
+            timestamp = datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            continue
+        _last_timestamp_format = fmt
+        return timestamp
+
+    return None
+
+
+def calculate_service_uptime(
+    properties: Dict[str, str], active_state: str, now_epoch: Optional[float] = None
+) -> Optional[str]:
+    """Calculate how long the service has been in its current state.
+
+    The *TimestampMonotonic properties (microseconds of CLOCK_MONOTONIC, which is also
+    time.monotonic_ns()) are used when available, as they need only integer math; the
+    textual timestamps are only parsed as a fallback.
+
+    Args:
+        properties: Properties reported by systemctl show
+        active_state: Current ActiveState of the service
+        now_epoch: Reference Unix time, so several services can share one clock reading (default: current time)
+    """
     try:
         # Determine which timestamp to use based on current state
         if active_state == "active":
-            timestamp_str = properties.get("ActiveEnterTimestamp", "")
+            timestamp_key = "ActiveEnterTimestamp"
+        elif properties.get("InactiveEnterTimestamp", ""):
+            timestamp_key = "InactiveEnterTimestamp"
         else:
             # For inactive states, try InactiveEnterTimestamp first, then StateChangeTimestamp
-            timestamp_str = properties.get("InactiveEnterTimestamp", "") or properties.get("StateChangeTimestamp", "")
+            timestamp_key = "StateChangeTimestamp"
+
+        monotonic_str = properties.get(timestamp_key + "Monotonic", "")
+        if monotonic_str.isdigit() and monotonic_str != "0":
+            return format_uptime_from_seconds((time.monotonic_ns() // 1000 - int(monotonic_str)) // 1000000)
 
+        timestamp_str = properties.get(timestamp_key, "")
         if not timestamp_str or timestamp_str == "0" or timestamp_str == "n/a":
             return None
 
+        if now_epoch is None:
+            now_epoch = time.time()
+
         # Parse systemd timestamp format
         try:
             # Systemd timestamps are typically in format like "Mon 2023-12-04 10:30:15 UTC" or Unix timestamp
             if timestamp_str.isdigit():
-                # Unix timestamp in microseconds
-                timestamp = datetime.fromtimestamp(int(timestamp_str) / 1000000)
+                # Unix timestamp in microseconds, no datetime needed
+                timestamp_epoch = int(timestamp_str) / 1000000
             else:
-                # Try to parse various timestamp formats
-                timestamp_formats = [
-                    "%a %Y-%m-%d %H:%M:%S %Z",  # "Tue 2024-11-19 14:39:37 CET"
-                    "%Y-%m-%d %H:%M:%S %Z",  # "2024-11-19 14:39:37 CET"
-                    "%Y-%m-%d %H:%M:%S",  # "2024-11-19 14:39:37"
-                    "%a %b %d %H:%M:%S %Y",  # "Tue Nov 19 14:39:37 2024"
-                ]
-
-                for fmt in timestamp_formats:
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    # If all parsing attempts fail, return None
+                # Try to parse various timestamp formats, which are local time
+                timestamp = parse_systemd_timestamp(timestamp_str)
+                if timestamp is None:
                     return None
-        except (ValueError, OSError):
+                timestamp_epoch = timestamp.timestamp()
+        except (ValueError, OSError, OverflowError):
             return None
 
-        # Calculate duration
-        now = datetime.now()
-        if timestamp.tzinfo is None:
-            # Use local time for comparison since systemd timestamps are typically local
-            timestamp = timestamp.replace(tzinfo=None)
-            now = datetime.now()
-
-        duration = now - timestamp
-
         # Format duration using the shared formatting function
-        return format_uptime_from_seconds(duration.total_seconds())
+        return format_uptime_from_seconds(now_epoch - timestamp_epoch)
 
     except Exception:
         return None
 
 
-async def get_service_info(service_config: ServiceConfig) -> ServiceInfo:
-    """Get information about a systemd service."""
-    # Special handling for kernel/dmesg service
-    if service_config.name == "kernel" or service_config.name == "dmesg":
-        # Calculate system uptime for kernel service
-        try:
-            boot_time = psutil.boot_time()
-            current_time = time.time()
-            uptime_seconds = current_time - boot_time
-            uptime_str = format_uptime_from_seconds(uptime_seconds)
-        except Exception:
-            uptime_str = None
-        
-        return ServiceInfo(
+def is_kernel_service(name: str) -> bool:
+    """Check if a configured service is the kernel logs pseudo-service."""
+    return name == "kernel" or name == "dmesg"
+
+
+def get_kernel_service_info(service_config: ServiceConfig) -> ServiceInfo:
+    """Get information about the kernel logs pseudo-service."""
+    # Calculate system uptime for kernel service
+    try:
+        boot_time = psutil.boot_time()
+        current_time = time.time()
+        uptime_seconds = current_time - boot_time
+        uptime_str = format_uptime_from_seconds(uptime_seconds)
+    except Exception:
+        uptime_str = None
+
+    return ServiceInfo(
+        name=service_config.name,
+        description="Kernel ring buffer logs (dmesg)",
+        active=True,  # Kernel is always "active"
+        enabled=True,
+        status="active",
+        uptime=uptime_str,
+        expert=service_config.expert,
+        is_target=False,
+        is_kernel=True,
+    )
+
+
+def parse_systemctl_properties(output: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines of a systemctl show block into a dictionary."""
+    return {key: value for key, sep, value in map(methodcaller("partition", "="), output.splitlines()) if sep}
+
+
+def service_info_from_properties(
+    service_config: ServiceConfig, properties: Dict[str, str], now_epoch: Optional[float] = None
+) -> ServiceInfo:
+    """Build service information from the properties reported by systemctl show.
+
+    All fields are produced here with the correct types, so the model is built
+    without validation (model_construct); this runs for every service on every /services request.
+    """
+    active_state = properties.get("ActiveState", "unknown")
+    unit_file_state = properties.get("UnitFileState", "unknown")
+    description = properties.get("Description", "No description available")
+    
+    # Check if this is a target unit (targets end with .target)
+    is_target = service_config.name.endswith(".target")
+
+    # Check if service is not found (empty UnitFileState and inactive + generic description)
+    service_not_found = unit_file_state == "" and active_state == "inactive" and description.endswith(".service")
+
+    if service_not_found:
+        return ServiceInfo.model_construct(
             name=service_config.name,
-            description="Kernel ring buffer logs (dmesg)",
-            active=True,  # Kernel is always "active"
-            enabled=True,
-            status="active",
-            uptime=uptime_str,
-            expert=service_config.expert,
+            description="Service not found",
+            active=False,
+            enabled=False,
+            status="not-found",
+            uptime=None,
+            expert=True,  # Force expert mode for unavailable services
             is_target=False,
-            is_kernel=True,
         )
-    
+
+    # Calculate uptime/downtime
+    uptime = calculate_service_uptime(properties, active_state, now_epoch)
+
+    return ServiceInfo.model_construct(
+        name=service_config.name,
+        description=description,
+        active=active_state == "active",
+        enabled=unit_file_state == "enabled",
+        status=active_state,
+        uptime=uptime,
+        expert=service_config.expert,
+        is_target=is_target,
+    )
+
+
+async def get_service_info(service_config: ServiceConfig) -> ServiceInfo:
+    """Get information about a systemd service."""
+    # Special handling for kernel/dmesg service
+    if is_kernel_service(service_config.name):
+        return get_kernel_service_info(service_config)
+
     try:
         # Get service status including timestamps and type
-        result = await run_subprocess_async(
-            [
-                "systemctl",
-                "show",
-                service_config.name,
-                "--no-pager",
-                "--property=ActiveState,UnitFileState,Description,ActiveEnterTimestamp,InactiveEnterTimestamp,StateChangeTimestamp,Type",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
+        async with _systemctl_semaphore:
+            result = await run_subprocess_async(
+                ["systemctl", "show", service_config.name, *SYSTEMCTL_SHOW_OPTIONS],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                stderr=subprocess.DEVNULL,
             )
 
         if result.returncode != 0:
@@ -207,48 +346,7 @@ async def get_service_info(service_config: ServiceConfig) -> ServiceInfo:
                 is_target=False,
             )
 
-        # Parse output
-        properties = {}
-        for line in result.stdout.strip().split("\n"):
-            if "=" in line:
-                key, value = line.split("=", 1)
-                properties[key] = value
-
-        active_state = properties.get("ActiveState", "unknown")
-        unit_file_state = properties.get("UnitFileState", "unknown")
-        description = properties.get("Description", "No description available")
-        
-        # Check if this is a target unit (targets end with .target)
-        is_target = service_config.name.endswith(".target")
-
-        # Check if service is not found (empty UnitFileState and inactive + generic description)
-        service_not_found = unit_file_state == "" and active_state == "inactive" and description.endswith(".service")
-
-        if service_not_found:
-            return ServiceInfo(
-                name=service_config.name,
-                description="Service not found",
-                active=False,
-                enabled=False,
-                status="not-found",
-                uptime=None,
-                expert=True,  # Force expert mode for unavailable services
-                is_target=False,
-            )
-
-        # Calculate uptime/downtime
-        uptime = calculate_service_uptime(properties, active_state)
-
-        return ServiceInfo(
-            name=service_config.name,
-            description=description,
-            active=active_state == "active",
-            enabled=unit_file_state == "enabled",
-            status=active_state,
-            uptime=uptime,
-            expert=service_config.expert,
-            is_target=is_target,
-        )
+        return service_info_from_properties(service_config, parse_systemctl_properties(result.stdout))
 
     except (subprocess.TimeoutExpired, asyncio.TimeoutError):
         return ServiceInfo(
@@ -274,17 +372,185 @@ async def get_service_info(service_config: ServiceConfig) -> ServiceInfo:
         )
 
 
+# Recently queried service information by service name: (time.monotonic() of the query, info)
+SERVICE_INFO_CACHE_TTL = 1.5  # seconds
+_service_info_cache: Dict[str, Tuple[float, ServiceInfo]] = {}
+# Incremented on every invalidation, so queries started before it do not store outdated results
+_service_info_generation = 0
+
+
+def invalidate_service_info(service_name: str) -> None:
+    """Drop cached information about a service, e.g. after its state was changed."""
+    global _service_info_generation
+    _service_info_generation += 1
+    _service_info_cache.pop(service_name, None)
+
+
+async def get_all_services_info(
+    services: List[ServiceConfig], max_age: float = SERVICE_INFO_CACHE_TTL
+) -> List[ServiceInfo]:
+    """Get information about several systemd services with a single systemctl show call.
+
+    systemctl show prints one property block per unit, separated by blank lines, in the
+    order the units were given. If the batched call fails or its output cannot be mapped
+    back to the services, each service is queried on its own instead.
+
+    Results younger than max_age seconds (default SERVICE_INFO_CACHE_TTL) are reused, so
+    rapid polling from several clients results in one systemd query per service and window.
+    """
+    units = [service for service in services if not is_kernel_service(service.name)]
+    unit_info: Dict[str, ServiceInfo] = {}
+
+    # Reuse recent results
+    generation = _service_info_generation
+    checked_at = time.monotonic()
+    for service in units:
+        cached = _service_info_cache.get(service.name)
+        if cached is not None and checked_at - cached[0] < max_age:
+            unit_info[service.name] = cached[1]
+    units = [service for service in units if service.name not in unit_info]
+
+    if units:
+        try:
+            result = await run_subprocess_async(
+                ["systemctl", "show", *(service.name for service in units), *SYSTEMCTL_SHOW_OPTIONS],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                stderr=subprocess.DEVNULL,
+            )
+            blocks = result.stdout.strip().split("\n\n") if result.returncode == 0 else []
+        except (subprocess.TimeoutExpired, asyncio.TimeoutError, OSError):
+            blocks = []
+
+        if len(blocks) == len(units):
+            now_epoch = time.time()
+            for service, block in zip(units, blocks):
+                try:
+                    properties = parse_systemctl_properties(block)
+                    unit_info[service.name] = service_info_from_properties(service, properties, now_epoch)
+                except Exception:
+                    # Leave it to the per-service query to report the error
+                    continue
+
+        # Query services the batched call could not answer on their own
+        missing = [service for service in units if service.name not in unit_info]
+        for service, info in zip(missing, await asyncio.gather(*(get_service_info(s) for s in missing))):
+            unit_info[service.name] = info
+
+        # Results of a query that overlapped an invalidation may predate a service action
+        if generation == _service_info_generation:
+            queried_at = time.monotonic()
+            for service in units:
+                _service_info_cache[service.name] = (queried_at, unit_info[service.name])
+
+    return [
+        get_kernel_service_info(service) if is_kernel_service(service.name) else unit_info[service.name]
+        for service in services
+    ]
+
+
+# Background refresh of the service status while clients request /services or /services/stream.
+# It runs at the interval the UI polls with (system.status_refresh_interval in tsconfig.yml).
+DEFAULT_STATUS_REFRESH_INTERVAL = 30.0  # seconds
+SERVICE_STATUS_REFRESH_IDLE_TIMEOUT = 30.0  # minimum seconds without requests until the refresh stops
+_service_status_refresher: Dict[str, Any] = {"task": None, "last_request": 0.0, "snapshot": None}
+# Set and cleared after every background refresh to wake up /services/stream clients
+_service_status_updated = asyncio.Event()
+
+
+def get_status_refresh_interval() -> float:
+    """Get the configured status refresh interval in seconds, using the default for invalid values."""
+    try:
+        interval = float(config_loader.get_status_refresh_interval())
+    except (TypeError, ValueError):
+        return DEFAULT_STATUS_REFRESH_INTERVAL
+    if not 0 < interval < float("inf"):
+        return DEFAULT_STATUS_REFRESH_INTERVAL
+    return interval
+
+
+async def _refresh_service_status() -> None:
+    """Refresh the service status cache periodically until /services is no longer requested."""
+    while True:
+        interval = get_status_refresh_interval()
+        idle_timeout = max(SERVICE_STATUS_REFRESH_IDLE_TIMEOUT, 2 * interval)
+        if time.monotonic() - _service_status_refresher["last_request"] >= idle_timeout:
+            break
+        generation = _service_info_generation
+        try:
+            services = get_configured_services(include_expert=True)
+            snapshot = await get_all_services_info(services, max_age=0)
+        except Exception:
+            snapshot = None
+        if generation != _service_info_generation:
+            # A service was changed during the refresh, query again instead of publishing the old state
+            continue
+        if snapshot is not None:
+            _service_status_refresher["snapshot"] = snapshot
+            _service_status_updated.set()
+            _service_status_updated.clear()
+        await asyncio.sleep(interval)
+
+
+def _ensure_service_status_refresher() -> float:
+    """Record a /services request and start the background refresh if it is not running.
+
+    Returns:
+        Maximum age of cached service status to serve: while the refresh was already running,
+        the cache is at most one refresh interval old, otherwise SERVICE_INFO_CACHE_TTL
+    """
+    _service_status_refresher["last_request"] = time.monotonic()
+    task = _service_status_refresher["task"]
+    if task is None or task.done():
+        _service_status_refresher["task"] = asyncio.create_task(_refresh_service_status())
+        return SERVICE_INFO_CACHE_TTL
+    return get_status_refresh_interval() + SERVICE_INFO_CACHE_TTL
+
+
 @router.get("/services", response_model=List[ServiceInfo])
-async def list_services():
-    """Get status of all configured systemd services."""
+async def list_services(
+    ttl_ms: Optional[int] = Query(None, ge=0, le=3600000, description="Maximum age of reused service status in ms"),
+):
+    """Get status of all configured systemd services.
+
+    While the status is refreshed in the background, it is served from the cache. Service
+    status queried within the last ttl_ms milliseconds is reused; use ttl_ms=0 to query
+    systemd directly.
+    """
     services = get_configured_services(include_expert=True)
-    service_info = []
+    max_age = _ensure_service_status_refresher()
+    if ttl_ms is not None:
+        max_age = ttl_ms / 1000
+    return await get_all_services_info(services, max_age)
+
+
+@router.get("/services/stream")
+async def stream_services():
+    """Stream the status of all configured systemd services as Server-Sent Events.
+
+    All connected clients share one background refresh of the service status; an event
+    with the JSON list of services is sent initially and whenever the status changes.
+    """
+
+    async def generate_status():
+        _ensure_service_status_refresher()
+        services = await get_all_services_info(get_configured_services(include_expert=True))
+        last_data = None
+        while True:
+            data = json.dumps([info.model_dump() for info in services])
+            if data != last_data:
+                yield f"data: {data}\n\n"
+                last_data = data
+            await _service_status_updated.wait()
+            _ensure_service_status_refresher()
+            services = _service_status_refresher["snapshot"] or services
 
-    for service in services:
-        info = await get_service_info(service)
-        service_info.append(info)
-
-    return service_info
+    return StreamingResponse(
+        generate_status(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
+    )
 
 
 @router.post("/action")
@@ -294,9 +560,7 @@ async def service_action(action: ServiceAction):
         raise HTTPException(status_code=400, detail="Invalid action. Must be start, stop, or restart")
 
     # Validate service is in our configured list
-    configured_services = get_configured_services(include_expert=True)
-    service_names = [service.name for service in configured_services]
-    if action.service not in service_names:
+    if action.service not in get_configured_service_names():
         raise HTTPException(status_code=400, detail="Service not in configured list")
     
     # Prevent actions on kernel service (it's not a real systemd service)
@@ -308,7 +572,12 @@ async def service_action(action: ServiceAction):
         cmd = ["systemctl", action.action, action.service]
 
         # Execute systemctl command
-        result = await run_subprocess_async(cmd, capture_output=True, text=True, timeout=30)
+        async with _systemd_write_lock:
+            try:
+                result = await run_subprocess_async(cmd, capture_output=True, text=True, timeout=30)
+            finally:
+                # The service state may have changed even if the command failed
+                invalidate_service_info(action.service)
 
         if result.returncode != 0:
             error_msg = result.stderr.strip() if result.stderr else f"Command failed with exit code {result.returncode}"
@@ -332,7 +601,8 @@ async def reboot_system():
     """Initiate system reboot."""
     try:
         # Use systemctl to reboot the system
-        result = await run_subprocess_async(["systemctl", "reboot"], capture_output=True, text=True, timeout=10)
+        async with _systemd_write_lock:
+            result = await run_subprocess_async(["systemctl", "reboot"], capture_output=True, text=True, timeout=10)
 
         if result.returncode != 0:
             raise HTTPException(status_code=500, detail=f"Failed to initiate reboot: {result.stderr}")
@@ -358,6 +628,12 @@ async def get_system_config():
         raise HTTPException(status_code=500, detail=f"Failed to get system configuration: {str(e)}")
 
 
+# Log streaming reads journalctl output in chunks of this size
+LOG_READ_CHUNK_SIZE = 4096
+# Seconds to wait for the rest of a line before sending it incomplete
+LOG_FLUSH_TIMEOUT = 0.25
+
+
 @router.get("/logs/{service_name}")
 async def stream_service_logs(service_name: str):
     """Stream journalctl logs for a specific service, kernel logs, or all system logs."""
@@ -366,16 +642,15 @@ async def stream_service_logs(service_name: str):
         pass  # Allow "all" without validation
     else:
         # Validate service is in our configured list
-        configured_services = get_configured_services(include_expert=True)
-        service_names = [service.name for service in configured_services]
-        if service_name not in service_names:
+        if service_name not in get_configured_service_names():
             raise HTTPException(status_code=400, detail="Service not in configured list")
 
     async def generate_logs():
         """Generate streaming logs using journalctl -fu, journalctl -kf for kernel, or journalctl -f for all."""
         # Send initial comment to establish the connection (comments don't trigger onmessage)
         yield f": Stream started\n\n"
-        
+
+        process = None
         try:
             # Special handling for all system logs
             if service_name == "all":
@@ -421,14 +696,32 @@ async def stream_service_logs(service_name: str):
                     stderr=asyncio.subprocess.STDOUT,
                 )
 
+            # Read output in chunks and split it into lines, instead of awaiting every line
+            pending = b""
             while True:
-                line = await process.stdout.readline()
-                if not line:
+                if not pending:
+                    # Nothing buffered, wait for output without waking up periodically
+                    chunk = await process.stdout.read(LOG_READ_CHUNK_SIZE)
+                else:
+                    try:
+                        chunk = await asyncio.wait_for(process.stdout.read(LOG_READ_CHUNK_SIZE), LOG_FLUSH_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        # No more output for now, send the incomplete last line as is
+                        yield f"data: {pending.decode('utf-8', errors='replace').rstrip()}\n\n"
+                        pending = b""
+                        continue
+                if not chunk:
                     break
 
-                # Decode and yield the line
-                log_line = line.decode("utf-8", errors="replace").rstrip()
-                yield f"data: {log_line}\n\n"
+                *lines, pending = (pending + chunk).split(b"\n")
+                if lines:
+                    # Send all complete lines of the chunk in one write, still one event per line
+                    yield "".join(
+                        f"data: {line.decode('utf-8', errors='replace').rstrip()}\n\n" for line in lines
+                    )
+
+            if pending:
+                yield f"data: {pending.decode('utf-8', errors='replace').rstrip()}\n\n"
 
         except Exception as e:
             yield f"data: Error streaming logs: {str(e)}\n\n"
@@ -697,10 +697,10 @@ export function soundscapepipeConfig() {
             }, 250);
         },
 
-        async loadAudioDevices() {
+        async loadAudioDevices(refresh = false) {
             this.loadingDevices = true;
             try {
-                const response = await fetch(apiUrl('/api/soundscapepipe/audio-devices'));
+                const response = await fetch(apiUrl(`/api/soundscapepipe/audio-devices?refresh=${refresh}`));
                 if (response.ok) {
                     this.audioDevices = await response.json();
                 } else {
@@ -11,6 +11,7 @@ async def run_subprocess_async(
     text: bool = True,
     timeout: Optional[float] = None,
     check: bool = False,
+    stderr: Optional[int] = None,
 ) -> subprocess.CompletedProcess:
     """Run a subprocess asynchronously without blocking the event loop.
     
@@ -23,6 +24,7 @@ async def run_subprocess_async(
         text: If True, decode stdout/stderr as text (default encoding)
         timeout: Maximum time in seconds to wait for the process
         check: If True, raise CalledProcessError on non-zero exit code
+        stderr: Where to send stderr instead of capturing it, e.g. subprocess.DEVNULL
         
     Returns:
         CompletedProcess instance with returncode, stdout, stderr attributes
@@ -35,10 +37,10 @@ async def run_subprocess_async(
     # Determine stdout/stderr handling
     if capture_output:
         stdout = asyncio.subprocess.PIPE
-        stderr = asyncio.subprocess.PIPE
+        if stderr is None:
+            stderr = asyncio.subprocess.PIPE
     else:
         stdout = None
-        stderr = None
     
     try:
         # Create subprocess asynchronously
@@ -0,0 +1,54 @@
+"""Tests for saving configuration files."""
+
+import os
+import stat
+
+import pytest
+import yaml
+
+from app.configs.schedule import ScheduleConfig
+
+
+def test_save_writes_yaml(tmp_path):
+    config = ScheduleConfig(config_dir=tmp_path)
+    config.save({"button_delay": "00:30"})
+
+    assert yaml.safe_load(config.config_file.read_text()) == {"button_delay": "00:30"}
+    assert not (tmp_path / "schedule.yml.tmp").exists()
+
+
+def test_save_keeps_file_mode(tmp_path):
+    config = ScheduleConfig(config_dir=tmp_path)
+    config.config_file.write_text("button_delay: '00:00'\n")
+    os.chmod(config.config_file, 0o600)
+
+    config.save({"button_delay": "00:30"})
+
+    assert stat.S_IMODE(config.config_file.stat().st_mode) == 0o600
+
+
+def test_save_replaces_symlink_target(tmp_path):
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    target = target_dir / "schedule.yml"
+    target.write_text("button_delay: '00:00'\n")
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "schedule.yml").symlink_to(target)
+
+    ScheduleConfig(config_dir=config_dir).save({"button_delay": "00:30"})
+
+    assert (config_dir / "schedule.yml").is_symlink()
+    assert yaml.safe_load(target.read_text()) == {"button_delay": "00:30"}
+
+
+@pytest.mark.skipif(os.geteuid() != 0, reason="changing file ownership requires root")
+def test_save_keeps_file_owner(tmp_path):
+    config = ScheduleConfig(config_dir=tmp_path)
+    config.config_file.write_text("button_delay: '00:00'\n")
+    os.chown(config.config_file, 1000, 1000)
+
+    config.save({"button_delay": "00:30"})
+
+    st = config.config_file.stat()
+    assert (st.st_uid, st.st_gid) == (1000, 1000)
@@ -0,0 +1,41 @@
+"""Tests for the soundscapepipe file scanning helpers."""
+
+from app.routers.soundscapepipe import LURE_AUDIO_EXTENSIONS, _scan_files
+
+
+def test_scan_files_matches_suffix_case_sensitively(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "model.onnx").touch()
+    (tmp_path / "nested" / "other.onnx").touch()
+    (tmp_path / "MODEL.ONNX").touch()
+
+    found = sorted(_scan_files(str(tmp_path), (".onnx",)))
+
+    assert found == [str(tmp_path / "model.onnx"), str(tmp_path / "nested" / "other.onnx")]
+
+
+def test_scan_files_lure_extensions(tmp_path):
+    for name in ("a.wav", "b.WAV", "c.Mp3", "d.txt", "e.wav.txt"):
+        (tmp_path / name).touch()
+    directories = []
+
+    found = sorted(_scan_files(str(tmp_path), LURE_AUDIO_EXTENSIONS, directories, ignore_case=True))
+
+    assert found == [str(tmp_path / "a.wav"), str(tmp_path / "b.WAV"), str(tmp_path / "c.Mp3")]
+    assert directories == []
+
+
+def test_scan_files_lists_symlinked_directories(tmp_path):
+    external = tmp_path / "usb"
+    external.mkdir()
+    (external / "song.wav").touch()
+    lure_base = tmp_path / "lure"
+    lure_base.mkdir()
+    (lure_base / "local").mkdir()
+    (lure_base / "stick").symlink_to(external, target_is_directory=True)
+    directories = []
+
+    found = _scan_files(str(lure_base), LURE_AUDIO_EXTENSIONS, directories, ignore_case=True)
+
+    assert sorted(directories) == [str(lure_base / "local"), str(lure_base / "stick")]
+    assert found == []
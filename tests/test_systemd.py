@@ -0,0 +1,101 @@
+"""Tests for the systemd router helpers."""
+
+import asyncio
+import subprocess
+import time
+from datetime import datetime
+
+import pytest
+
+from app.routers import systemd
+from app.routers.systemd import calculate_service_uptime
+
+
+def test_uptime_from_textual_timestamp():
+    """Timestamps without weekday and timezone start and end with a digit, but are not Unix timestamps."""
+    started = datetime(2024, 11, 19, 14, 39, 37)
+    now_epoch = started.timestamp() + 2 * 86400 + 3 * 3600 + 4 * 60
+
+    properties = {"ActiveEnterTimestamp": "2024-11-19 14:39:37"}
+    assert calculate_service_uptime(properties, "active", now_epoch) == "2d 3h 4m"
+
+
+def test_uptime_from_weekday_timestamp():
+    started = datetime(2024, 11, 19, 14, 39, 37)
+    now_epoch = started.timestamp() + 125
+
+    properties = {"InactiveEnterTimestamp": "Tue 2024-11-19 14:39:37 UTC"}
+    assert calculate_service_uptime(properties, "inactive", now_epoch) == "2m 5s"
+
+
+def test_uptime_from_unix_microseconds():
+    properties = {"ActiveEnterTimestamp": "1700000000000000"}
+    assert calculate_service_uptime(properties, "active", 1700000000 + 3600) == "1h 0m"
+
+
+def test_uptime_from_monotonic_timestamp():
+    started_us = time.monotonic_ns() // 1000 - 90 * 1000000
+    properties = {"ActiveEnterTimestamp": "garbage", "ActiveEnterTimestampMonotonic": str(started_us)}
+    assert calculate_service_uptime(properties, "active") in ("1m 30s", "1m 31s")
+
+
+def test_uptime_without_timestamp():
+    assert calculate_service_uptime({"ActiveEnterTimestamp": ""}, "active") is None
+    assert calculate_service_uptime({"ActiveEnterTimestampMonotonic": "0"}, "active") is None
+
+
+@pytest.mark.parametrize(
+    ("configured", "expected"),
+    [(5, 5.0), ("2.5", 2.5), ("fast", 30.0), (None, 30.0), (0, 30.0), (-1, 30.0), (float("inf"), 30.0)],
+)
+def test_status_refresh_interval(monkeypatch, configured, expected):
+    monkeypatch.setattr(systemd.config_loader, "get_status_refresh_interval", lambda: configured)
+    assert systemd.get_status_refresh_interval() == expected
+
+
+SHOW_OUTPUT = "ActiveState=active\nUnitFileState=enabled\nDescription=Test service\n"
+
+
+def test_service_info_cached(monkeypatch):
+    calls = []
+
+    async def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, SHOW_OUTPUT, "")
+
+    monkeypatch.setattr(systemd, "run_subprocess_async", fake_run)
+    monkeypatch.setattr(systemd, "_service_info_cache", {})
+    services = [systemd.ServiceConfig(name="test.service")]
+
+    first = asyncio.run(systemd.get_all_services_info(services))
+    second = asyncio.run(systemd.get_all_services_info(services))
+
+    assert len(calls) == 1
+    assert first[0].status == second[0].status == "active"
+
+
+def test_service_info_not_cached_across_invalidation(monkeypatch):
+    async def fake_run(cmd, **kwargs):
+        # A service action finishes while the status query is running
+        systemd.invalidate_service_info("test.service")
+        return subprocess.CompletedProcess(cmd, 0, SHOW_OUTPUT, "")
+
+    monkeypatch.setattr(systemd, "run_subprocess_async", fake_run)
+    monkeypatch.setattr(systemd, "_service_info_cache", {})
+    services = [systemd.ServiceConfig(name="test.service")]
+
+    info = asyncio.run(systemd.get_all_services_info(services))
+
+    assert info[0].status == "active"
+    assert "test.service" not in systemd._service_info_cache
+
+
+@pytest.mark.parametrize(("value", "expected"), [("4", 4), ("0", 1), ("sixteen", 16), ("", 16)])
+def test_systemctl_concurrency_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv("TSCONFIG_SYSTEMCTL_CONCURRENCY", value)
+    assert systemd._systemctl_concurrency_from_env() == expected
+
+
+def test_systemctl_concurrency_default(monkeypatch):
+    monkeypatch.delenv("TSCONFIG_SYSTEMCTL_CONCURRENCY", raising=False)
+    assert systemd._systemctl_concurrency_from_env() == 16